@@ -4,17 +4,27 @@ Multi-agent system for academic grading using Google ADK.
 Architecture: Root Agent -> Rubric Validator -> Grading Pipeline -> Feedback
 """
 
-import os
-import asyncio
+import logging
 
+from google.adk.agents.context_cache_config import ContextCacheConfig
 from google.adk.apps.app import App, EventsCompactionConfig
 from google.adk.plugins import LoggingPlugin
 from google.adk.runners import Runner
-from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.sessions.base_session_service import BaseSessionService
 from google.genai import types
 
 # Import configuration
-from config import APP_NAME, USER_ID, DATA_DIR
+from config import (
+    ADK_LOGGING_PLUGIN,
+    APP_NAME,
+    SESSION_BACKEND,
+    SESSION_CACHE_SIZE,
+    SESSION_DB_URL,
+    SQLITE_SESSION_DB_URL,
+    init_config,
+)
+
+init_config()
 
 # Import agents
 from agents import root_agent, build_graders_from_rubric
@@ -22,42 +32,109 @@ from agents import root_agent, build_graders_from_rubric
 # Import plugins
 from plugins import RubricGuardrailPlugin
 
-print("✅ Smart Grading Assistant - Loading...")
+from services.session_store import BoundedInMemorySessionService
+
+logger = logging.getLogger(__name__)
+logger.info("Smart Grading Assistant - Loading...")
 
 # =============================================================================
 # APP CONFIGURATION
 # =============================================================================
 
+plugins = [RubricGuardrailPlugin(build_graders_fn=build_graders_from_rubric)]
+if ADK_LOGGING_PLUGIN:
+    # Debug aid only: LoggingPlugin print()s every callback synchronously.
+    plugins.insert(0, LoggingPlugin())
+
 grading_app = App(
     name=APP_NAME,
     root_agent=root_agent,
-    plugins=[
-        LoggingPlugin(),
-        RubricGuardrailPlugin(build_graders_fn=build_graders_from_rubric),
-    ],
+    plugins=plugins,
     events_compaction_config=EventsCompactionConfig(
         compaction_interval=6,  # summarize history every 6 invocations
         overlap_size=2,         # keep last 2 turns verbatim for continuity
     ),
+    # Cache the stable prompt prefix (instructions + rubric turn) so graders and
+    # later turns reuse it at the discounted cached-token rate.
+    context_cache_config=ContextCacheConfig(
+        # Gemini 2.5 minimums are 1024 (Flash) and 2048 (Pro) tokens; 2048
+        # clears both, so the same setting works whichever MODEL is set.
+        min_tokens=2048,
+        ttl_seconds=600,
+        cache_intervals=10,
+    ),
 )
 
-print("✅ App configured with context compaction (Resumability disabled)")
+logger.info("App configured with context compaction and context caching (Resumability disabled)")
 
 # =============================================================================
 # SESSION & RUNNER SETUP
 # =============================================================================
 
-# Use SQLite for persistent sessions
-# db_path = os.path.join(DATA_DIR, "grading_sessions.db")
-# db_url = f"sqlite:///{db_path}"
-session_service = InMemorySessionService()
+_SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",       # ADK sets this itself only for engines it creates
+    "PRAGMA journal_mode=WAL",      # readers don't block the writer
+    "PRAGMA synchronous=NORMAL",    # fsync at checkpoints, not every commit
+    "PRAGMA busy_timeout=5000",     # wait instead of "database is locked"
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",     # ~20 MB page cache
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _create_sqlite_engine(db_url: str):
+    """Async SQLite engine tuned for concurrent session-event writes."""
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
 
-# Create runner with DatabaseSessionService
+    engine = create_async_engine(db_url, connect_args={"check_same_thread": False})
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+def build_session_service(backend: str = SESSION_BACKEND) -> BaseSessionService:
+    """Create the session service selected by SESSION_BACKEND.
+
+    - memory: in-process sessions, LRU-bounded by SESSION_CACHE_SIZE (default)
+    - sqlite: DatabaseSessionService on SESSION_DB_PATH (under DATA_DIR)
+    - postgres: DatabaseSessionService on SESSION_DB_URL, for concurrent writers
+    """
+    backend = (backend or "memory").strip().lower()
+    if backend == "memory":
+        return BoundedInMemorySessionService(max_sessions=SESSION_CACHE_SIZE)
+
+    if backend == "sqlite":
+        db_url = SESSION_DB_URL or SQLITE_SESSION_DB_URL
+        if not db_url.startswith("sqlite"):
+            raise ValueError("SESSION_DB_URL must be a sqlite URL when SESSION_BACKEND=sqlite")
+        db_options = {"db_engine": _create_sqlite_engine(db_url)}
+    elif backend == "postgres":
+        if not SESSION_DB_URL:
+            raise ValueError("SESSION_DB_URL must be set when SESSION_BACKEND=postgres")
+        db_options = {"db_url": SESSION_DB_URL}
+    else:
+        raise ValueError(f"Unsupported SESSION_BACKEND: {backend!r}")
+
+    from google.adk.sessions.database_session_service import DatabaseSessionService
+
+    return DatabaseSessionService(**db_options)
+
+
+session_service = build_session_service()
+
+# Create runner with the configured session service
 runner = Runner(
     app=grading_app,
     session_service=session_service,
 )
 
-print(f"✅ Runner configured with DatabaseSessionService")
-#print(f"   Database: {db_path}")
+logger.info(
+    "Runner configured with %s (%s)", type(session_service).__name__, SESSION_BACKEND
+)
 
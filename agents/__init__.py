@@ -1,28 +1,57 @@
-"""Agents module for the Smart Grading Assistant."""
-
-from .rubric_validator import rubric_validator_agent
-from .graders import (
-    create_criterion_grader,
-    build_graders_from_rubric,
-    parallel_graders,
-    DEFAULT_GRADE_OUTPUT_KEYS,
-)
-from .aggregator import aggregator_agent
-from .approval import approval_agent, finalize_grade, needs_approval
-from .feedback import feedback_agent
-from .root import root_agent, grading_pipeline
-
-__all__ = [
-    "rubric_validator_agent",
-    "create_criterion_grader",
-    "build_graders_from_rubric",
-    "parallel_graders",
-    "DEFAULT_GRADE_OUTPUT_KEYS",
-    "aggregator_agent",
-    "approval_agent",
-    "finalize_grade",
-    "needs_approval",
-    "feedback_agent",
-    "root_agent",
-    "grading_pipeline",
-]
+"""Agents module for the Smart Grading Assistant.
+
+Names are resolved on first access (PEP 562), so importing the package, or a
+single factory from it, does not build the whole agent tree. Agent instances
+(e.g. `root_agent`) come from the matching cached `get_*` factory.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "create_rubric_validator_agent": ".rubric_validator",
+    "get_rubric_validator_agent": ".rubric_validator",
+    "create_criterion_grader": ".graders",
+    "build_graders_from_rubric": ".graders",
+    "get_parallel_graders": ".graders",
+    "DEFAULT_GRADE_OUTPUT_KEYS": ".graders",
+    "create_aggregator_agent": ".aggregator",
+    "get_aggregator_agent": ".aggregator",
+    "create_approval_agent": ".approval",
+    "get_approval_agent": ".approval",
+    "finalize_grade": ".approval",
+    "needs_approval": ".approval",
+    "create_feedback_agent": ".feedback",
+    "get_feedback_agent": ".feedback",
+    "get_root_agent": ".root",
+    "get_grading_pipeline": ".root",
+}
+
+# Legacy instance names -> the factory that builds (and caches) them.
+_AGENT_FACTORIES = {
+    "rubric_validator_agent": "get_rubric_validator_agent",
+    "parallel_graders": "get_parallel_graders",
+    "aggregator_agent": "get_aggregator_agent",
+    "approval_agent": "get_approval_agent",
+    "feedback_agent": "get_feedback_agent",
+    "grading_pipeline": "get_grading_pipeline",
+    "root_agent": "get_root_agent",
+}
+
+__all__ = list(_EXPORTS) + list(_AGENT_FACTORIES)
+
+
+def __getattr__(name: str):
+    factory = _AGENT_FACTORIES.get(name)
+    if factory is not None:
+        value = __getattr__(factory)()
+    else:
+        module_name = _EXPORTS.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
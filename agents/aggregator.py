@@ -1,19 +1,26 @@
 """Aggregator Agent - combines criterion grades into final score."""
 
+import functools
+import logging
+
 from google.adk.agents import LlmAgent
 
 from services.llm_provider import get_model, get_agent_generate_config
-from config import MODEL_LITE, retry_config
 from models.schemas import AggregationResult
 from tools.calculate_score import calculate_final_score
 
 
-aggregator_agent = LlmAgent(
-    name="AggregatorAgent",
-    model=get_model(),
-    generate_content_config=get_agent_generate_config(),
-    description="Aggregates individual criterion grades into a final score",
-    instruction="""You are a grade aggregator. Your job is to calculate the final score.
+logger = logging.getLogger(__name__)
+
+
+def create_aggregator_agent() -> LlmAgent:
+    """Factory function to create the AggregatorAgent."""
+    return LlmAgent(
+        name="AggregatorAgent",
+        model=get_model(),
+        generate_content_config=get_agent_generate_config(),
+        description="Aggregates individual criterion grades into a final score",
+        instruction="""You are a grade aggregator. Your job is to calculate the final score.
 
 STEP 1: Call calculate_final_score with the grades from session state.
         The grader_output_keys in state tells you which keys have grades.
@@ -28,9 +35,15 @@ The calculate_final_score tool will:
 - Determine if human approval is needed (< 50% or > 90%)
 
 Return the final result in the required JSON format.""",
-    tools=[calculate_final_score],
-    output_schema=AggregationResult,
-    output_key="aggregation_result",
-)
-
-print("✅ AggregatorAgent created")
+        tools=[calculate_final_score],
+        output_schema=AggregationResult,
+        output_key="aggregation_result",
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_aggregator_agent() -> LlmAgent:
+    """AggregatorAgent used by the grading pipeline (built once)."""
+    agent = create_aggregator_agent()
+    logger.debug("AggregatorAgent created")
+    return agent
@@ -1,11 +1,16 @@
 """Approval Agent - handles human-in-the-loop for edge case grades."""
 
+import functools
+import logging
+
 from google.adk.agents import LlmAgent
 from google.adk.tools import FunctionTool
 from google.adk.tools.tool_context import ToolContext
 
 from services.llm_provider import get_model, get_agent_generate_config
-from config import MODEL_LITE, retry_config
+
+
+logger = logging.getLogger(__name__)
 
 
 def finalize_grade(
@@ -39,7 +44,7 @@ def finalize_grade(
     }
 
 
-async def needs_approval(
+def needs_approval(
     final_score: float,
     max_score: float,
     percentage: float,
@@ -47,38 +52,52 @@ async def needs_approval(
     reason: str,
     tool_context: ToolContext | None = None,
 ) -> bool:
-    """Returns True if the grade requires human approval."""
+    """Returns True if the grade requires human approval.
 
-    if tool_context is not None:
-        try:
-            aggregation_result = tool_context.state.get("aggregation_result")
-        except Exception:
-            aggregation_result = None
+    Plain function on purpose: ADK accepts sync `require_confirmation`
+    callables, so no coroutine is scheduled for this check.
+    """
+    # Cheapest check first: edge-case percentages always need a human.
+    if percentage < 50 or percentage > 90:
+        return True
 
-        if isinstance(aggregation_result, dict):
-            if aggregation_result.get("requires_human_approval") is True:
-                return True
+    if tool_context is None:
+        return False
 
-            if aggregation_result.get("failed_criteria") or aggregation_result.get("missing_grade_keys"):
-                return True
+    try:
+        aggregation_result = tool_context.state.get("aggregation_result")
+    except Exception:
+        return False
 
-    return percentage < 50 or percentage > 90
+    return isinstance(aggregation_result, dict) and bool(
+        aggregation_result.get("requires_human_approval") is True
+        or aggregation_result.get("failed_criteria")
+        or aggregation_result.get("missing_grade_keys")
+    )
 
 
-approval_agent = LlmAgent(
-    name="ApprovalAgent",
-    model=get_model(),
-    generate_content_config=get_agent_generate_config(),
-    description="Handles human approval for edge case grades",
-    instruction="""You finalize grades. 
+def create_approval_agent() -> LlmAgent:
+    """Factory function to create the ApprovalAgent."""
+    return LlmAgent(
+        name="ApprovalAgent",
+        model=get_model(),
+        generate_content_config=get_agent_generate_config(),
+        description="Handles human approval for edge case grades",
+        instruction="""You finalize grades. 
     
     Read the aggregation_result from session state (saved by AggregatorAgent).
     Call finalize_grade ONCE with the values from aggregation_result.
     
     The system will automatically request human confirmation if the grade is an edge case.
     After calling finalize_grade, do NOT generate additional text.""",
-    tools=[FunctionTool(finalize_grade, require_confirmation=needs_approval)],
-    output_key="approval_result",
-)
+        tools=[FunctionTool(finalize_grade, require_confirmation=needs_approval)],
+        output_key="approval_result",
+    )
+
 
-print("✅ ApprovalAgent created")
+@functools.lru_cache(maxsize=None)
+def get_approval_agent() -> LlmAgent:
+    """ApprovalAgent used by the grading pipeline (built once)."""
+    agent = create_approval_agent()
+    logger.debug("ApprovalAgent created")
+    return agent
@@ -1,108 +1,86 @@
 """Grader agents for evaluating submissions against rubric criteria."""
 
 import asyncio
+import functools
 import logging
-from typing import List, Optional, Tuple
-
-from pydantic import ValidationError
+import sys
+import weakref
+from typing import ClassVar, List, Optional, Tuple
 
 from google.adk.agents import BaseAgent, LlmAgent, ParallelAgent
-from google.adk.agents.invocation_context import InvocationContext
-from google.adk.events.event import Event
-from google.adk.utils.context_utils import Aclosing
 
-from config import GRADER_CONCURRENCY_LIMIT, retry_config
+from config import GRADER_CONCURRENCY_LIMIT
 from services.llm_provider import get_agent_generate_config_for, get_model
 from models.schemas import CriterionGrade
 from utils.text_utils import slugify
 
+from .retry import MAX_ATTEMPTS, RetryingLlmAgent
+
 
-_grader_semaphore = asyncio.Semaphore(GRADER_CONCURRENCY_LIMIT)
+logger = logging.getLogger(__name__)
+
+# One semaphore shared by every grader, so GRADER_CONCURRENCY_LIMIT caps total
+# in-flight LLM calls across all criteria. asyncio primitives bind to the loop
+# that first waits on them and the UI grades each submission in a fresh loop,
+# so there is one semaphore per running loop.
+_grader_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
-class EmptyGraderOutputError(RuntimeError):
-    pass
+def get_grader_semaphore() -> asyncio.Semaphore:
+    """Return the grader concurrency semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _grader_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _grader_semaphores[loop] = asyncio.Semaphore(GRADER_CONCURRENCY_LIMIT)
+    return semaphore
 
+# Shared boilerplate first, criterion data last: every grader's prompt starts
+# with the same prefix, which provider-side prefix caching can reuse.
+_GRADER_INSTRUCTION = """You are an expert evaluator grading ONE rubric criterion of a student submission.
+
+IMPORTANT: The student submission is available in session state as "submission_text".
+Look for the code/text that was submitted by the student.
 
-class RetryingGraderAgent(BaseAgent):
-    inner_agent: LlmAgent
-    output_key: str
+Your task:
+1. Find and read the student's submission from the conversation or state
+2. Evaluate it against the criterion given at the end of these instructions
+3. Determine a score from 0 to the criterion's Maximum Score
+4. Return your evaluation as structured JSON with these EXACT fields:
+   - criterion_name: the criterion name, exactly as given below
+   - max_score: the Maximum Score given below
+   - score: your determined score (number between 0 and the Maximum Score)
+   - evaluation_notes: your detailed evaluation justification (keep it concise; max 300 characters; no newlines)
+
+Be fair, consistent, and constructive in your evaluation notes.
+Focus ONLY on this criterion. Do NOT include any text outside the JSON structure.
+
+Criterion: "{criterion_name}"
+Criterion Description: {criterion_description}
+Maximum Score: {max_score} points"""
+
+
+class RetryingGraderAgent(RetryingLlmAgent):
     criterion_name: str
     max_score: int
-    semaphore: asyncio.Semaphore = _grader_semaphore
-    max_attempts: int = 3
 
-    def __getattr__(self, item: str):
-        try:
-            return super().__getattr__(item)
-        except AttributeError:
-            inner_agent = object.__getattribute__(self, "inner_agent")
-            if hasattr(inner_agent, item):
-                return getattr(inner_agent, item)
-            raise
-
-    async def _run_async_impl(self, ctx: InvocationContext):
-        last_error: Optional[Exception] = None
-        last_error_type: str = "validation"
-        for attempt in range(1, self.max_attempts + 1):
-            try:
-                ctx.end_of_agents.pop(self.inner_agent.name, None)
-            except Exception:
-                pass
-            saw_output = False
-            try:
-                async with self.semaphore:
-                    async with Aclosing(self.inner_agent.run_async(ctx)) as agen:
-                        async for event in agen:
-                            try:
-                                state_delta = getattr(getattr(event, "actions", None), "state_delta", None)
-                                if isinstance(state_delta, dict) and self.output_key in state_delta:
-                                    candidate = state_delta.get(self.output_key)
-                                    if isinstance(candidate, dict) and (
-                                        "score" in candidate or "criterion_name" in candidate
-                                    ):
-                                        saw_output = True
-                                    elif candidate is not None:
-                                        saw_output = True
-                            except Exception:
-                                pass
-                            yield event
-                if not saw_output:
-                    raise EmptyGraderOutputError(
-                        f"Empty or missing output for key '{self.output_key}'"
-                    )
-                return
-            except (ValidationError, EmptyGraderOutputError) as exc:
-                last_error = exc
-                if isinstance(exc, EmptyGraderOutputError):
-                    last_error_type = "empty_output"
-                else:
-                    last_error_type = "validation"
-                if attempt >= self.max_attempts:
-                    break
-                initial_delay = float(getattr(retry_config, "initial_delay", 1.0) or 1.0)
-                exp_base = float(getattr(retry_config, "exp_base", 2.0) or 2.0)
-                delay = min(10.0, initial_delay * (exp_base ** (attempt - 1)))
-                await asyncio.sleep(delay)
-
-        error_payload = {
-            "error_type": last_error_type,
-            "error_message": str(last_error) if last_error else "Unknown validation error",
-            "recoverable": True,
-            "suggestion": "Retry grading for this criterion.",
-            "attempts": self.max_attempts,
-            "criterion_name": self.criterion_name,
-            "max_score": self.max_score,
-        }
-
-        error_key = f"{self.output_key}_error"
-        event = Event(
-            invocation_id=ctx.invocation_id,
-            author=self.name,
-            branch=ctx.branch,
-        )
-        event.actions.state_delta[error_key] = error_payload
-        yield event
+    # Transport/provider errors were already retried by the model client;
+    # keep the failure local to this criterion instead of aborting the whole
+    # ParallelGraders fan-out.
+    catch_unexpected_errors: ClassVar[bool] = True
+    retry_suggestion: ClassVar[str] = "Retry grading for this criterion."
+
+    def _attempt_context(self) -> asyncio.Semaphore:
+        return get_grader_semaphore()
+
+    def _error_payload(
+        self, error_type: str, error: Optional[Exception], attempts: int
+    ) -> dict:
+        payload = super()._error_payload(error_type, error, attempts)
+        payload["criterion_name"] = self.criterion_name
+        payload["max_score"] = self.max_score
+        return payload
 
 
 def create_criterion_grader(
@@ -119,7 +97,8 @@ def create_criterion_grader(
     """
     slug = criterion_slug or slugify(criterion_name)
     grader_name = f"Grader_{slug}"
-    output_key = f"grade_{slug}"
+    # Interned: the same key indexes session state in graders, guardrail and scoring.
+    output_key = sys.intern(f"grade_{slug}")
 
     generate_content_config = get_agent_generate_config_for("grader")
 
@@ -128,26 +107,13 @@ def create_criterion_grader(
         model=get_model(),
         generate_content_config=generate_content_config,
         description=f"Evaluates submissions for: {criterion_name}",
-        instruction=f"""You are an expert evaluator for the criterion: \"{criterion_name}\"
-        
-Criterion Description: {criterion_description}
-Maximum Score: {max_score} points
-
-IMPORTANT: The student submission is available in session state as "submission_text".
-Look for the code/text that was submitted by the student.
-
-Your task:
-1. Find and read the student's submission from the conversation or state
-2. Evaluate it against this specific criterion: {criterion_name}
-3. Determine a score from 0 to {max_score}
-4. Return your evaluation as structured JSON with these EXACT fields:
-   - criterion_name: \"{criterion_name}\"
-   - max_score: {max_score}
-   - score: your determined score (number between 0 and {max_score})
-   - evaluation_notes: your detailed evaluation justification (keep it concise; max 300 characters; no newlines)
-
-Be fair, consistent, and constructive in your evaluation notes.
-Focus ONLY on this criterion. Do NOT include any text outside the JSON structure.""",
+        instruction=_GRADER_INSTRUCTION.format_map(
+            {
+                "criterion_name": criterion_name,
+                "criterion_description": criterion_description,
+                "max_score": max_score,
+            }
+        ),
         output_schema=CriterionGrade,
         output_key=output_key,
     )
@@ -159,12 +125,43 @@ Focus ONLY on this criterion. Do NOT include any text outside the JSON structure
         output_key=output_key,
         criterion_name=criterion_name,
         max_score=max_score,
-        max_attempts=max(1, int(getattr(retry_config, "attempts", 3) or 3)),
+        max_attempts=MAX_ATTEMPTS,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_criterion_grader(
+    criterion_name: str,
+    criterion_description: str,
+    max_score: int,
+    criterion_slug: str,
+    settings_key: Tuple[str, ...],
+) -> BaseAgent:
+    """Reuse grader agents across rubric builds; `settings_key` only keys the cache."""
+    return create_criterion_grader(
+        criterion_name, criterion_description, max_score, criterion_slug=criterion_slug
+    )
+
+
+def _grader_settings_key() -> Tuple[str, ...]:
+    """Resolved model and generate config, so changed settings miss the cache."""
+    model = get_model()
+    config = get_agent_generate_config_for("grader")
+    return (
+        type(model).__name__,
+        str(getattr(model, "model", model)),
+        config.model_dump_json(exclude_none=True),
     )
 
 
 def build_graders_from_rubric(rubric: dict) -> Tuple[List[BaseAgent], List[str]]:
-    """Build grader agents and their output keys from rubric criteria."""
+    """Build grader agents and their output keys from rubric criteria.
+
+    Graders hold no per-run state, so identical criteria (e.g. the same rubric
+    used for a whole class) share one agent instead of rebuilding it per run.
+    Criteria with unhashable values (e.g. a list description) are built uncached.
+    """
+    settings_key = _grader_settings_key()
     graders: List[BaseAgent] = []
     grade_keys: List[str] = []
     criteria = rubric.get("criteria") or []
@@ -174,42 +171,38 @@ def build_graders_from_rubric(rubric: dict) -> Tuple[List[BaseAgent], List[str]]
         max_score = criterion.get("max_score") or 0
         slug = criterion.get("slug") or slugify(name)
         try:
-            graders.append(create_criterion_grader(name, desc, max_score, criterion_slug=slug))
-            grade_keys.append(f"grade_{slug}")
+            try:
+                grader = _cached_criterion_grader(name, desc, max_score, slug, settings_key)
+            except TypeError:
+                grader = create_criterion_grader(name, desc, max_score, criterion_slug=slug)
+            graders.append(grader)
+            grade_keys.append(sys.intern(f"grade_{slug}"))
         except Exception as exc:
-            logging.warning("Failed to create grader for criterion '%s': %s", name, exc)
+            logger.warning("Failed to create grader for criterion '%s': %s", name, exc)
     return graders, grade_keys
 
 
 # Default graders for Python code rubric (will be replaced dynamically when rubric is provided)
-code_quality_grader = create_criterion_grader(
-    "Code Quality", 
-    "Evaluate code readability, naming conventions, and PEP 8 adherence",
-    30
+_DEFAULT_CRITERIA: Tuple[Tuple[str, str, int], ...] = (
+    ("Code Quality", "Evaluate code readability, naming conventions, and PEP 8 adherence", 30),
+    ("Functionality", "Evaluate if the code correctly solves the problem", 40),
+    ("Documentation", "Evaluate docstrings, comments, and code explanation", 30),
 )
 
-functionality_grader = create_criterion_grader(
-    "Functionality",
-    "Evaluate if the code correctly solves the problem",
-    40
-)
+DEFAULT_GRADE_OUTPUT_KEYS = [sys.intern(f"grade_{slugify(name)}") for name, _, _ in _DEFAULT_CRITERIA]
 
-documentation_grader = create_criterion_grader(
-    "Documentation",
-    "Evaluate docstrings, comments, and code explanation",
-    30
-)
 
-DEFAULT_GRADE_OUTPUT_KEYS = [
-    code_quality_grader.output_key,
-    functionality_grader.output_key,
-    documentation_grader.output_key,
-]
+def create_parallel_graders() -> ParallelAgent:
+    """Factory function to create the ParallelGraders group with the default graders."""
+    return ParallelAgent(
+        name="ParallelGraders",  # Name expected by guardrail
+        sub_agents=[create_criterion_grader(*criterion) for criterion in _DEFAULT_CRITERIA],
+    )
 
-# Grading agent group (parallel execution for efficiency)
-parallel_graders = ParallelAgent(
-    name="ParallelGraders",  # Name expected by guardrail
-    sub_agents=[code_quality_grader, functionality_grader, documentation_grader],
-)
 
-print("✅ Graders module loaded (3 default criterion graders, parallel mode)")
+@functools.lru_cache(maxsize=None)
+def get_parallel_graders() -> ParallelAgent:
+    """Default ParallelGraders group; the guardrail swaps in rubric graders per run."""
+    agent = create_parallel_graders()
+    logger.debug("ParallelGraders built (%d default criteria)", len(_DEFAULT_CRITERIA))
+    return agent
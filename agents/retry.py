@@ -0,0 +1,142 @@
+"""Retry schedule and base wrapper shared by the grader and feedback agents."""
+
+import asyncio
+import contextlib
+import logging
+import random
+from typing import Any, AsyncContextManager, ClassVar, Optional, Tuple
+
+from pydantic import ValidationError
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events.event import Event
+from google.adk.utils.context_utils import Aclosing
+
+from config import retry_config
+
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = max(1, int(getattr(retry_config, "attempts", 3) or 3))
+_INITIAL_DELAY = float(getattr(retry_config, "initial_delay", 1.0) or 1.0)
+_EXP_BASE = float(getattr(retry_config, "exp_base", 2.0) or 2.0)
+_MAX_DELAY = float(getattr(retry_config, "max_delay", 30.0) or 30.0)
+# Upper bound of the delay before retry N+1 (index N-1).
+_BACKOFF: Tuple[float, ...] = tuple(
+    min(_MAX_DELAY, _INITIAL_DELAY * (_EXP_BASE ** i)) for i in range(MAX_ATTEMPTS)
+)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Seconds to wait after failed `attempt` (1-based) before the next one.
+
+    Full jitter keeps concurrent retries from hitting the provider in lockstep.
+    """
+    return random.uniform(0, _BACKOFF[min(attempt, len(_BACKOFF)) - 1])
+
+
+class EmptyOutputError(RuntimeError):
+    pass
+
+
+class RetryingLlmAgent(BaseAgent):
+    """Run `inner_agent` until it writes `output_key`, retrying with backoff.
+
+    When every attempt fails, an `<output_key>_error` payload is written to
+    state instead of raising, so downstream agents can report the failure.
+    """
+
+    inner_agent: LlmAgent
+    output_key: str
+    max_attempts: int = MAX_ATTEMPTS
+
+    # Errors other than validation/empty output: re-raise, or record and stop.
+    catch_unexpected_errors: ClassVar[bool] = False
+    retry_suggestion: ClassVar[str] = "Retry this step."
+
+    # Explicit read-only views of the wrapped LlmAgent's configuration.
+    @property
+    def model(self):
+        return self.inner_agent.model
+
+    @property
+    def generate_content_config(self):
+        return self.inner_agent.generate_content_config
+
+    @property
+    def instruction(self):
+        return self.inner_agent.instruction
+
+    @property
+    def output_schema(self):
+        return self.inner_agent.output_schema
+
+    def _attempt_context(self) -> AsyncContextManager[Any]:
+        """Held around each attempt; subclasses may use it to cap concurrency."""
+        return contextlib.nullcontext()
+
+    def _error_payload(
+        self, error_type: str, error: Optional[Exception], attempts: int
+    ) -> dict:
+        return {
+            "error_type": error_type,
+            "error_message": str(error) if error else "Unknown validation error",
+            "recoverable": True,
+            "suggestion": self.retry_suggestion,
+            "attempts": attempts,
+        }
+
+    async def _run_async_impl(self, ctx: InvocationContext):
+        last_error: Optional[Exception] = None
+        last_error_type: str = "validation"
+        output_key = self.output_key
+        inner_agent = self.inner_agent
+        inner_name = inner_agent.name
+        max_attempts = self.max_attempts
+        attempts = 0
+        for attempt in range(1, max_attempts + 1):
+            attempts = attempt
+            ctx.end_of_agents.pop(inner_name, None)
+            saw_output = False
+            try:
+                async with self._attempt_context():
+                    async with Aclosing(inner_agent.run_async(ctx)) as agen:
+                        async for event in agen:
+                            if saw_output:
+                                yield event
+                                continue
+                            actions = event.actions
+                            state_delta = actions.state_delta if actions is not None else None
+                            if state_delta and state_delta.get(output_key) is not None:
+                                saw_output = True
+                            yield event
+                if not saw_output:
+                    raise EmptyOutputError(f"Empty or missing output for key '{output_key}'")
+                return
+            except (ValidationError, EmptyOutputError) as exc:
+                last_error = exc
+                if isinstance(exc, EmptyOutputError):
+                    last_error_type = "empty_output"
+                else:
+                    last_error_type = "validation"
+                if attempt >= max_attempts:
+                    break
+                await asyncio.sleep(backoff_delay(attempt))
+            except Exception as exc:
+                if not self.catch_unexpected_errors:
+                    raise
+                logger.warning("'%s' failed: %s", self.name, exc)
+                last_error = exc
+                last_error_type = "grading"
+                break
+
+        event = Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+        )
+        event.actions.state_delta[f"{output_key}_error"] = self._error_payload(
+            last_error_type, last_error, attempts
+        )
+        yield event
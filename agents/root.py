@@ -1,42 +1,57 @@
 """Root Agent - orchestrates the entire grading workflow."""
 
+import functools
+import logging
+
 from google.adk.agents import LlmAgent, SequentialAgent
 from google.adk.tools import FunctionTool
 from google.adk.tools.agent_tool import AgentTool
 
 from services.llm_provider import get_model, get_agent_generate_config
-from .rubric_validator import rubric_validator_agent
-from config import MODEL_LITE, MODEL, retry_config
 from tools.save_submission import save_submission
-from .graders import parallel_graders
-from .aggregator import aggregator_agent
-from .approval import approval_agent
-from .feedback import feedback_agent
+from tools.validate_rubric import validate_rubric
+
+
+logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def get_grading_pipeline() -> SequentialAgent:
+    """Shared GradingPipeline, built (with its sub-agents) on first use."""
+    from .aggregator import get_aggregator_agent
+    from .approval import get_approval_agent
+    from .feedback import get_feedback_agent
+    from .graders import get_parallel_graders
 
-grading_pipeline = SequentialAgent(
-    name="GradingPipeline",
-    description="Executes the grading workflow with structured outputs.",
-    sub_agents=[
-        parallel_graders,   
-        aggregator_agent,   
-        approval_agent,     
-        feedback_agent,     
-    ],
-)
+    pipeline = SequentialAgent(
+        name="GradingPipeline",
+        description="Executes the grading workflow with structured outputs.",
+        sub_agents=[
+            get_parallel_graders(),
+            get_aggregator_agent(),
+            get_approval_agent(),
+            get_feedback_agent(),
+        ],
+    )
+    logger.debug("GradingPipeline created (SequentialAgent with structured outputs)")
+    return pipeline
 
-print("✅ GradingPipeline created (SequentialAgent with structured outputs)")
 
-root_agent = LlmAgent(
-    name="SmartGradingAssistant",
-    model=get_model(),
-    generate_content_config=get_agent_generate_config(),
-    description="Main coordinator for the Smart Grading Assistant",
-    instruction="""You are the Smart Grading Assistant. You control rubric validation and submission storage directly, then delegate grading to a specialized pipeline.
+@functools.lru_cache(maxsize=None)
+def get_root_agent() -> LlmAgent:
+    """Shared root agent (SmartGradingAssistant), built on first use."""
+    from .rubric_validator import get_rubric_validator_agent
+
+    agent = LlmAgent(
+        name="SmartGradingAssistant",
+        model=get_model(),
+        generate_content_config=get_agent_generate_config(),
+        description="Main coordinator for the Smart Grading Assistant",
+        instruction="""You are the Smart Grading Assistant. You control rubric validation and submission storage directly, then delegate grading to a specialized pipeline.
 
 TOOLS AVAILABLE:
-- rubric_validator_agent: Validates a grading rubric (JSON format) call another agent tool. This is a GATE - you cannot grade without a valid rubric.
+- validate_rubric: Validates a grading rubric (pass the rubric JSON string as rubric_json). This is a GATE - you cannot grade without a valid rubric.
+- RubricValidatorAgent: Agent tool that explains rubric problems in detail. Only use it when validate_rubric reports errors the user needs help fixing.
 - save_submission: Saves the student's submission text for evaluation.
 
 SUB-AGENT AVAILABLE:
@@ -60,13 +75,15 @@ RULES:
 - NEVER transfer to GradingPipeline without a saved submission.
 - Respond in the user's language.
 - Be helpful and guide the user through the process.""",
-    tools=[
-        AgentTool(agent=rubric_validator_agent),
-        FunctionTool(save_submission),
-    ],
-    sub_agents=[grading_pipeline]
-)
-
-print("✅ Root Agent (SmartGradingAssistant) created")
-print("   Design: Hybrid - tools for validation/submission, SequentialAgent for grading pipeline")
-
+        tools=[
+            # Deterministic check first; the validator agent only costs an
+            # extra LLM round trip when a rubric needs explaining.
+            FunctionTool(validate_rubric),
+            AgentTool(agent=get_rubric_validator_agent()),
+            FunctionTool(save_submission),
+        ],
+        sub_agents=[get_grading_pipeline()],
+    )
+    logger.debug("Root Agent (SmartGradingAssistant) created")
+    logger.debug("Design: Hybrid - tools for validation/submission, SequentialAgent for grading pipeline")
+    return agent
@@ -1,18 +1,25 @@
 """Rubric Validator Agent - validates rubric structure before grading."""
 
+import functools
+import logging
+
 from google.adk.agents import LlmAgent
 
 from services.llm_provider import get_model, get_agent_generate_config
-from config import MODEL_LITE, retry_config
 from tools.validate_rubric import validate_rubric
 
 
-rubric_validator_agent = LlmAgent(
-    name="RubricValidatorAgent",
-    model=get_model(),
-    generate_content_config=get_agent_generate_config(),
-    description="Validates the structure and completeness of grading rubrics",
-    instruction="""You are a rubric validation specialist. Your job is to validate 
+logger = logging.getLogger(__name__)
+
+
+def create_rubric_validator_agent() -> LlmAgent:
+    """Factory function to create the RubricValidatorAgent."""
+    return LlmAgent(
+        name="RubricValidatorAgent",
+        model=get_model(),
+        generate_content_config=get_agent_generate_config(),
+        description="Validates the structure and completeness of grading rubrics",
+        instruction="""You are a rubric validation specialist. Your job is to validate 
     grading rubrics before they are used for evaluation.
 
     When you receive a rubric:
@@ -26,8 +33,14 @@ rubric_validator_agent = LlmAgent(
 
     Your tone should be professional, clear, and encouraging. Assume the user is a teacher who may not be technical.
     Always be precise and helpful in your feedback.""",
-    tools=[validate_rubric],
-    output_key="validation_result",
-)
+        tools=[validate_rubric],
+        output_key="validation_result",
+    )
+
 
-print("✅ RubricValidatorAgent created")
+@functools.lru_cache(maxsize=None)
+def get_rubric_validator_agent() -> LlmAgent:
+    """RubricValidatorAgent exposed to the root agent as an agent tool (built once)."""
+    agent = create_rubric_validator_agent()
+    logger.debug("RubricValidatorAgent created")
+    return agent
@@ -15,13 +15,22 @@ from .settings import (
     GRADER_CONCURRENCY_LIMIT,
     GRADER_TEMPERATURE,
     GRADER_MAX_OUTPUT_TOKENS,
+    GRADER_TIER,
     FEEDBACK_TEMPERATURE,
     FEEDBACK_MAX_OUTPUT_TOKENS,
+    SESSION_BACKEND,
+    SESSION_DB_PATH,
+    SQLITE_SESSION_DB_URL,
+    SESSION_DB_URL,
+    SESSION_CACHE_SIZE,
     OPENAI_GPT5_MIN_OUTPUT_TOKENS,
+    ADK_LOGGING_PLUGIN,
     DEFAULT_MODEL,
     FAILING_THRESHOLD,
     EXCEPTIONAL_THRESHOLD,
     retry_config,
+    init_config,
+    parse_service_tier,
 )
 
 __all__ = [
@@ -39,11 +48,20 @@ __all__ = [
     "GRADER_CONCURRENCY_LIMIT",
     "GRADER_TEMPERATURE",
     "GRADER_MAX_OUTPUT_TOKENS",
+    "GRADER_TIER",
     "FEEDBACK_TEMPERATURE",
     "FEEDBACK_MAX_OUTPUT_TOKENS",
+    "SESSION_BACKEND",
+    "SESSION_DB_PATH",
+    "SQLITE_SESSION_DB_URL",
+    "SESSION_DB_URL",
+    "SESSION_CACHE_SIZE",
     "OPENAI_GPT5_MIN_OUTPUT_TOKENS",
+    "ADK_LOGGING_PLUGIN",
     "DEFAULT_MODEL",
     "FAILING_THRESHOLD",
     "EXCEPTIONAL_THRESHOLD",
     "retry_config",
+    "init_config",
+    "parse_service_tier",
 ]
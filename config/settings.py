@@ -1,7 +1,11 @@
 """Configuration settings for the Smart Grading Assistant."""
 
+import atexit
 import os
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
 from dotenv import load_dotenv
 from google.genai import types
 
@@ -12,9 +16,25 @@ BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 LOG_PATH = os.path.join(BASE_DIR, "logs", "grading_agent.log")
 DATA_DIR = os.path.join(BASE_DIR, "data")
 
-# Create directories
-os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
-os.makedirs(DATA_DIR, exist_ok=True)
+_SERVICE_TIERS = frozenset(tier.value for tier in types.ServiceTier)
+
+
+def parse_service_tier(value: str) -> str:
+    """Return `value` as a Gemini service tier, falling back to "standard".
+
+    An unknown tier would otherwise make every GenerateContentConfig that
+    uses it fail to build.
+    """
+    tier = (value or "").strip().lower()
+    if tier in _SERVICE_TIERS:
+        return tier
+    logging.getLogger(__name__).warning(
+        "Unknown Gemini service tier %r; using 'standard' (expected one of %s)",
+        value,
+        ", ".join(sorted(_SERVICE_TIERS)),
+    )
+    return "standard"
+
 
 # Models
 MODEL_LITE = os.getenv("MODEL_LITE", "gemini-2.5-flash-lite")
@@ -29,10 +49,21 @@ OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 GRADER_CONCURRENCY_LIMIT = max(1, int(os.getenv("GRADER_CONCURRENCY_LIMIT", "2")))
 GRADER_TEMPERATURE = float(os.getenv("GRADER_TEMPERATURE", "0.1"))
 GRADER_MAX_OUTPUT_TOKENS = int(os.getenv("GRADER_MAX_OUTPUT_TOKENS", "384"))
+GRADER_TIER = parse_service_tier(os.getenv("GRADER_TIER") or "standard")
 FEEDBACK_TEMPERATURE = float(os.getenv("FEEDBACK_TEMPERATURE", "0.5"))
 FEEDBACK_MAX_OUTPUT_TOKENS = int(os.getenv("FEEDBACK_MAX_OUTPUT_TOKENS", "2048"))
+
+# Session storage: "memory" (default), "sqlite" (DATA_DIR file) or "postgres"
+SESSION_BACKEND = (os.getenv("SESSION_BACKEND") or "memory").strip().lower()
+SESSION_DB_PATH = os.path.join(DATA_DIR, "grading_sessions.db")
+SQLITE_SESSION_DB_URL = f"sqlite+aiosqlite:///{SESSION_DB_PATH}"
+SESSION_DB_URL = (os.getenv("SESSION_DB_URL") or "").strip()
+SESSION_CACHE_SIZE = max(1, int(os.getenv("SESSION_CACHE_SIZE", "1024")))  # memory backend only
 OPENAI_GPT5_MIN_OUTPUT_TOKENS = int(os.getenv("OPENAI_GPT5_MIN_OUTPUT_TOKENS", "2048"))
 
+# ADK's LoggingPlugin print()s every callback to stdout; keep it for debugging only.
+ADK_LOGGING_PLUGIN = (os.getenv("ADK_LOGGING_PLUGIN") or "").strip().lower() in ("1", "true", "yes")
+
 # Defaults
 DEFAULT_MODEL = OPENAI_MODEL
 
@@ -47,18 +78,46 @@ EXCEPTIONAL_THRESHOLD = 90
 # Retry configuration for LLM calls
 retry_config = types.HttpRetryOptions(
     attempts=5,
-    exp_base=7,
-    initial_delay=1,
+    exp_base=2,
+    initial_delay=0.5,
+    max_delay=30,
 )
 
-# Configure logging
-logging.basicConfig(
-    filename=LOG_PATH,
-    level=logging.INFO,
-    format="%(asctime)s - %(filename)s:%(lineno)s - %(levelname)s - %(message)s",
-)
+_INITIALIZED = False
+log_listener: Optional[QueueListener] = None
+
+
+def init_config() -> None:
+    """Create runtime directories and configure logging.
+
+    Kept out of import time so `from config import ...` stays free of
+    filesystem work; entry points call this once. Safe to call repeatedly.
+    """
+    global _INITIALIZED, log_listener
+    if _INITIALIZED:
+        return
+    _INITIALIZED = True
+
+    os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+    os.makedirs(DATA_DIR, exist_ok=True)
+
+    # Callers only enqueue records; a background listener thread does the
+    # file writes so they never block the asyncio event loop.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    file_handler = RotatingFileHandler(LOG_PATH, maxBytes=10 * 1024 * 1024, backupCount=3)
+    file_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(filename)s:%(lineno)s - %(levelname)s - %(message)s")
+    )
+    log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 
-print(f"✅ Configuration loaded")
-print(f"   LOG_PATH: {LOG_PATH}")
-print(f"   DATA_DIR: {DATA_DIR}")
-print(f"   LLM_PROVIDER: {LLM_PROVIDER}")
+    logger = logging.getLogger(__name__)
+    logger.info("Configuration loaded")
+    logger.info("LOG_PATH: %s", LOG_PATH)
+    logger.info("DATA_DIR: %s", DATA_DIR)
+    logger.info("LLM_PROVIDER: %s", LLM_PROVIDER)
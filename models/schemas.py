@@ -14,6 +14,8 @@ class CriterionGrade(BaseModel):
     """Result of grading a single criterion."""
 
     model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
         json_schema_extra={
             "example": {
                 "criterion_name": "Code Quality",
@@ -33,7 +35,7 @@ class CriterionGrade(BaseModel):
 class GradeDetail(BaseModel):
     """Individual grade detail for aggregation."""
 
-    #model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
     criterion: str = Field(description="Criterion name")
     score: float = Field(ge=0, description="Score awarded")
@@ -44,7 +46,7 @@ class GradeDetail(BaseModel):
 class AggregationResult(BaseModel):
     """Final aggregated grading result."""
 
-    #model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
     total_score: float = Field(description="Sum of all criterion scores")
     max_possible: float = Field(description="Sum of all max scores")
@@ -58,7 +60,7 @@ class AggregationResult(BaseModel):
 class FinalFeedback(BaseModel):
     """Structured feedback for the student."""
 
-    #model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
     strengths: List[str] = Field(description="What the student did well")
     areas_for_improvement: List[str] = Field(description="Specific areas to improve")
@@ -70,7 +72,7 @@ class FinalFeedback(BaseModel):
 class GradingError(BaseModel):
     """Structured error response."""
 
-    #model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
     error_type: str = Field(description="Type of error (validation, grading, aggregation)")
     error_message: str = Field(description="Human-readable error description")
@@ -1,7 +1,10 @@
 """Rubric Guardrail Plugin - ensures rubric is validated before grading."""
 
+import functools
 import json
 import logging
+import re
+import string
 from typing import Any, Optional
 
 from google.adk.agents import BaseAgent
@@ -10,6 +13,63 @@ from google.adk.plugins.base_plugin import BasePlugin
 from google.genai import types
 
 
+logger = logging.getLogger(__name__)
+
+# Agents that must not run until the rubric has been validated.
+_PROTECTED_AGENTS: frozenset[str] = frozenset({
+    "ParallelGraders",
+    "AggregatorAgent",
+    "ApprovalAgent",
+    "FeedbackGeneratorAgent",
+    "Grader_Code_Quality",
+    "Grader_Functionality",
+    "Grader_Documentation",
+})
+
+_INVALID_RE = re.compile(r"invalid|error|missing|failed", re.IGNORECASE)
+_VALID_RE = re.compile(r"valid", re.IGNORECASE)
+
+_NO_ERRORS_DETAIL = "  - Rubric was not validated"
+
+_BLOCK_TEMPLATE = string.Template("""
+🚫 **GRADING BLOCKED BY GUARDRAIL**
+
+Agent '$agent' cannot proceed because the rubric validation failed.
+
+**Validation Errors:**
+$errors
+
+**What to do:**
+1. Review the rubric structure
+2. Ensure all required fields are present (name, criteria with name/max_score/description)
+3. Submit a corrected rubric
+
+No grading was performed. The pipeline has been safely stopped.
+""")
+
+
+@functools.lru_cache(maxsize=32)
+def _normalize_text_payload(payload: str) -> Optional[dict]:
+    """Parse a text validator response; cached since every protected agent re-reads it.
+
+    Callers treat the returned dict as read-only.
+    """
+    try:
+        parsed = json.loads(payload)
+        if isinstance(parsed, dict):
+            return parsed
+    except (json.JSONDecodeError, TypeError):
+        pass
+    if _INVALID_RE.search(payload):
+        return {
+            "status": "invalid",
+            "errors": ["Rubric validation failed - see validator response"],
+        }
+    if _VALID_RE.search(payload):
+        return {"status": "valid"}
+    return None
+
+
 class RubricGuardrailPlugin(BasePlugin):
     """Guardrail to ensure rubric is valid before running grading agents.
 
@@ -30,65 +90,41 @@ class RubricGuardrailPlugin(BasePlugin):
         if isinstance(payload, dict):
             return payload
         if isinstance(payload, str):
-            try:
-                parsed = json.loads(payload)
-                if isinstance(parsed, dict):
-                    return parsed
-            except (json.JSONDecodeError, TypeError):
-                pass
-            text = payload.lower()
-            if any(keyword in text for keyword in ["invalid", "error", "missing", "failed"]):
-                return {
-                    "status": "invalid",
-                    "errors": ["Rubric validation failed - see validator response"],
-                }
-            if "valid" in text and "invalid" not in text:
-                return {"status": "valid"}
+            return _normalize_text_payload(payload)
         return None
 
-    def _get_state_dict(self, callback_context: CallbackContext) -> dict:
-        """Safely get state as dict from callback_context."""
+    def _get_state_value(self, callback_context: CallbackContext, key: str) -> Any:
+        """Read one key from session state without copying the whole state."""
         try:
-            return callback_context.state.to_dict()
+            return callback_context.state.get(key)
         except Exception:
-            return {}
+            return None
+
+    def _get_session_state_value(self, callback_context: CallbackContext, key: str) -> Any:
+        """Fallback lookup in the invocation context's session state."""
+        inv_ctx = getattr(callback_context, "_invocation_context", None)
+        if not inv_ctx:
+            return None
+        session_state = getattr(inv_ctx, "session_state", None) or {}
+        return session_state.get(key)
 
     def _get_rubric(self, callback_context: CallbackContext) -> Optional[dict]:
         """Get the latest rubric dict from state or invocation context."""
-        state_dict = self._get_state_dict(callback_context)
-        rubric = state_dict.get("rubric")
+        rubric = self._get_state_value(callback_context, "rubric")
+        if isinstance(rubric, dict):
+            return rubric
+        rubric = self._get_session_state_value(callback_context, "rubric")
         if isinstance(rubric, dict):
             return rubric
-        inv_ctx = getattr(callback_context, "_invocation_context", None)
-        if inv_ctx:
-            session_state = getattr(inv_ctx, "session_state", {}) or {}
-            rubric = session_state.get("rubric")
-            if isinstance(rubric, dict):
-                return rubric
         return None
 
     def _get_validation_result(self, callback_context: CallbackContext) -> Optional[dict]:
         """Extract rubric validation status from session state."""
-        state_sources = []
-
-        try:
-            state_sources.append(callback_context.state.to_dict())
-        except Exception:
-            pass
-
-        inv_ctx = getattr(callback_context, "_invocation_context", None)
-        if inv_ctx:
-            session_state = getattr(inv_ctx, "session_state", {}) or {}
-            state_sources.append(session_state)
-
-        for source in state_sources:
-            if not source:
-                continue
+        for get_value in (self._get_state_value, self._get_session_state_value):
             for key in ("rubric_validation", "validation_result"):
-                if key in source:
-                    normalized = self._normalize_validation_payload(source.get(key))
-                    if normalized:
-                        return normalized
+                normalized = self._normalize_validation_payload(get_value(callback_context, key))
+                if normalized:
+                    return normalized
         return None
 
     def _is_rubric_valid(self, callback_context: CallbackContext) -> bool:
@@ -114,62 +150,45 @@ class RubricGuardrailPlugin(BasePlugin):
         except Exception:
             pass
 
-    def _build_block_message(self, agent_name: str, callback_context: CallbackContext) -> str:
+    def _build_block_message(self, agent_name: str, validation_result: Optional[dict]) -> str:
         """Build a user-friendly blocking message."""
-        validation_result = self._get_validation_result(callback_context)
         errors = []
         if validation_result:
             errors = validation_result.get("errors", [])
         
-        error_details = "\n".join(f"  - {e}" for e in errors) if errors else "  - Rubric was not validated"
-        
-        return f"""
-🚫 **GRADING BLOCKED BY GUARDRAIL**
-
-Agent '{agent_name}' cannot proceed because the rubric validation failed.
-
-**Validation Errors:**
-{error_details}
-
-**What to do:**
-1. Review the rubric structure
-2. Ensure all required fields are present (name, criteria with name/max_score/description)
-3. Submit a corrected rubric
-
-No grading was performed. The pipeline has been safely stopped.
-"""
+        error_details = (
+            "  - " + "\n  - ".join(map(str, errors)) if errors else _NO_ERRORS_DETAIL
+        )
+        return _BLOCK_TEMPLATE.substitute(agent=agent_name, errors=error_details)
 
     async def before_agent_callback(
         self, *, agent: BaseAgent, callback_context: CallbackContext
     ) -> Optional[types.Content]:
         """Block grading agents when rubric is not valid."""
-        protected_agents = {
-            "ParallelGraders",
-            "AggregatorAgent",
-            "ApprovalAgent",
-            "FeedbackGeneratorAgent",
-            "Grader_Code_Quality",
-            "Grader_Functionality",
-            "Grader_Documentation",
-        }
-
-        if agent.name not in protected_agents:
+        if agent.name not in _PROTECTED_AGENTS:
             return None
 
         validation_result = self._get_validation_result(callback_context)
-        print(f"[RubricGuardrail] before_agent_callback - agent={agent.name}, validation_result={validation_result}")
+        logger.debug(
+            "[RubricGuardrail] before_agent_callback - agent=%s, validation_result=%s",
+            agent.name,
+            validation_result,
+        )
 
         if validation_result and validation_result.get("status") == "valid":
             if agent.name == "ParallelGraders":
                 self._ensure_dynamic_graders(agent, callback_context)
-            print(f"[RubricGuardrail] ALLOW agent '{agent.name}' (rubric valid)")
+            logger.debug("[RubricGuardrail] ALLOW agent '%s' (rubric valid)", agent.name)
             return None
 
         self._blocked_agents.add(agent.name)
-        logging.warning("[RubricGuardrail] BLOCKED agent '%s' - rubric not valid.", agent.name)
-        print(f"[RubricGuardrail] BLOCK agent '{agent.name}' (rubric invalid or missing)")
+        logger.warning("[RubricGuardrail] BLOCKED agent '%s' - rubric not valid.", agent.name)
 
         return types.Content(
             role="model",
-            parts=[types.Part(text=self._build_block_message(agent.name, callback_context))],
+            parts=[
+                types.Part(
+                    text=self._build_block_message(agent.name, validation_result)
+                )
+            ],
         )
@@ -1,24 +1,23 @@
+import functools
 import logging
-from math import log
 from typing import Optional
 import os
 
-from google.adk.models.lite_llm import LiteLlm
 from google.adk.models.google_llm import Gemini
 from google.genai import types
-from google.genai.types import GenerationConfig
 from config import (
     MODEL,
-    MODEL_LITE,
     retry_config,
     LLM_PROVIDER,
     OPENAI_BASE_URL,
     OPENAI_MODEL,
     GRADER_TEMPERATURE,
     GRADER_MAX_OUTPUT_TOKENS,
+    GRADER_TIER,
     FEEDBACK_TEMPERATURE,
     FEEDBACK_MAX_OUTPUT_TOKENS,
     OPENAI_GPT5_MIN_OUTPUT_TOKENS,
+    parse_service_tier,
 )
 
 DEFAULT_SAFETY_SETTINGS = [
@@ -29,12 +28,23 @@ DEFAULT_SAFETY_SETTINGS = [
 ]
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_gemini(gemini_cls, model: str):
+    """One Gemini instance per model, so every agent reuses its genai client.
+
+    The client (and its HTTP connection pool) is created lazily per event
+    loop by the Gemini instance, so sharing the instance shares the pool.
+    """
+    return gemini_cls(model=model, retry_options=retry_config)
+
+
 def get_model():
     """Return a configured Gemini model for all ADK agents.
 
-    For now, this always uses the lightweight model defined by MODEL_LITE.
+    For now, this always uses the model defined by MODEL.
     If you later decide to use different models per agent, centralize that
-    logic here without changing call sites.
+    logic here without changing call sites. Gemini instances are shared
+    across agents so concurrent graders reuse the same connections.
     """
     provider = (os.getenv("LLM_PROVIDER") or "gemini").strip().lower()
     if provider == "openai":
@@ -53,11 +63,33 @@ def get_model():
         if model_name.startswith("gpt-5") and "/" not in model_name:
             model_name = f"openai/{model_name}"
 
-        logging.info(f"Using OpenAI model: {model_name}")
+        # Imported here: litellm takes about a second to import and the
+        # default Gemini path never needs it.
+        from google.adk.models.lite_llm import LiteLlm
+
+        logging.info("Using OpenAI model: %s", model_name)
         return LiteLlm(model=model_name, drop_params=True)
 
-    logging.info(f"Using Gemini model: {MODEL}")
-    return Gemini(model=MODEL, retry_options=retry_config)
+    logging.info("Using Gemini model: %s", MODEL)
+    return _shared_gemini(Gemini, MODEL)
+
+
+@functools.lru_cache(maxsize=16)
+def _default_safety_generate_config(
+    temperature: float,
+    max_output_tokens: int,
+    top_p: Optional[float],
+    top_k: Optional[float],
+    service_tier: Optional[str],
+) -> types.GenerateContentConfig:
+    return types.GenerateContentConfig(
+        temperature=temperature,
+        max_output_tokens=max_output_tokens,
+        top_p=top_p,
+        top_k=top_k,
+        safety_settings=DEFAULT_SAFETY_SETTINGS,
+        service_tier=service_tier,
+    )
 
 
 def get_agent_generate_config(
@@ -67,17 +99,29 @@ def get_agent_generate_config(
     top_p: float = None,
     top_k: Optional[float] = None,
     safety_settings: Optional[list[types.SafetySetting]] = None,
+    service_tier: Optional[str] = None,
 ) -> types.GenerateContentConfig:
     """Default generation config for all ADK agents.
 
     Central place to tune temperature, token limits and safety settings.
+    `service_tier` selects the Gemini pricing/latency tier (flex, standard,
+    priority); None keeps the API default (standard).
+
+    Configs using the default safety settings are cached and shared between
+    agents; ADK copies the config per request, so sharing is safe. Treat the
+    returned object as read-only.
     """
-    return types.GenerateContentConfig(
-        temperature=temperature,
-        max_output_tokens=max_output_tokens,
-        top_p=top_p,
-        top_k=top_k,
-        safety_settings=safety_settings or DEFAULT_SAFETY_SETTINGS,
+    if safety_settings:
+        return types.GenerateContentConfig(
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+            top_p=top_p,
+            top_k=top_k,
+            safety_settings=safety_settings,
+            service_tier=service_tier,
+        )
+    return _default_safety_generate_config(
+        temperature, max_output_tokens, top_p, top_k, service_tier
     )
 
 
@@ -87,7 +131,10 @@ def get_agent_generate_config_for(agent_kind: str) -> types.GenerateContentConfi
 
     if kind == "grader":
         if provider != "openai":
-            return get_agent_generate_config()
+            # Standard by default: the slowest grader sets pipeline latency,
+            # so best-effort `flex` is opt-in (e.g. for batch grading).
+            grader_tier = parse_service_tier(os.getenv("GRADER_TIER") or GRADER_TIER)
+            return get_agent_generate_config(service_tier=grader_tier)
         temperature = float(os.getenv("GRADER_TEMPERATURE", str(GRADER_TEMPERATURE)))
         max_output_tokens = int(
             os.getenv("GRADER_MAX_OUTPUT_TOKENS", str(GRADER_MAX_OUTPUT_TOKENS))
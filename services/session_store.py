@@ -0,0 +1,52 @@
+"""Session storage helpers for the grading runner."""
+
+from collections import OrderedDict
+from typing import Any, Optional
+
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.sessions.session import Session
+
+
+class BoundedInMemorySessionService(InMemorySessionService):
+    """InMemorySessionService that keeps at most `max_sessions` sessions.
+
+    The stock service never forgets a session, so a long-running UI process
+    grows without bound. Sessions are tracked in LRU order (create and get
+    count as use) and the least recently used one is dropped on overflow.
+    """
+
+    def __init__(self, max_sessions: int = 1024) -> None:
+        super().__init__()
+        self.max_sessions = max(1, int(max_sessions))
+        self._lru: "OrderedDict[tuple[str, str, str], None]" = OrderedDict()
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        session = await super().create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+        self._lru[(app_name, user_id, session.id)] = None
+        while len(self._lru) > self.max_sessions:
+            old_app, old_user, old_id = self._lru.popitem(last=False)[0]
+            self._delete_session_impl(app_name=old_app, user_id=old_user, session_id=old_id)
+        return session
+
+    async def get_session(self, *, app_name: str, user_id: str, session_id: str, config=None):
+        session = await super().get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+        if session is not None:
+            key = (app_name, user_id, session.id)
+            if key in self._lru:
+                self._lru.move_to_end(key)
+        return session
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        await super().delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+        self._lru.pop((app_name, user_id, session_id), None)
@@ -0,0 +1,43 @@
+from agents.graders import build_graders_from_rubric
+
+
+def _rubric(description):
+    return {
+        "name": "Rubric",
+        "criteria": [
+            {"name": "Clarity", "description": description, "max_score": 10, "slug": "clarity"},
+        ],
+    }
+
+
+def test_build_graders_reuses_cached_grader(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "gemini")
+    monkeypatch.setenv("GRADER_TIER", "standard")
+
+    first, keys = build_graders_from_rubric(_rubric("Is the code clear?"))
+    second, _ = build_graders_from_rubric(_rubric("Is the code clear?"))
+
+    assert keys == ["grade_clarity"]
+    assert first[0] is second[0]
+
+
+def test_build_graders_rebuilds_when_grader_settings_change(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "gemini")
+    monkeypatch.setenv("GRADER_TIER", "standard")
+    first, _ = build_graders_from_rubric(_rubric("Is the code clear?"))
+
+    monkeypatch.setenv("GRADER_TIER", "priority")
+    second, _ = build_graders_from_rubric(_rubric("Is the code clear?"))
+
+    assert first[0] is not second[0]
+    assert second[0].generate_content_config.service_tier.value == "priority"
+
+
+def test_build_graders_builds_unhashable_criteria_uncached(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "gemini")
+
+    graders, keys = build_graders_from_rubric(_rubric(["Naming", "Comments"]))
+
+    assert [g.name for g in graders] == ["Grader_clarity"]
+    assert keys == ["grade_clarity"]
+    assert "Naming" in graders[0].instruction
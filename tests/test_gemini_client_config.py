@@ -47,6 +47,17 @@ def test_get_model_uses_global_model_and_retry(monkeypatch, dummy_retry_config):
     assert captured["retry_options"] is dummy_retry_config
 
 
+def test_get_model_shares_gemini_instance(monkeypatch):
+    """Repeated get_model calls must reuse one Gemini (and its HTTP client)."""
+    monkeypatch.setenv("LLM_PROVIDER", "gemini")
+
+    first = get_model()
+    second = get_model()
+
+    assert isinstance(first, Gemini)
+    assert first is second
+
+
 def test_get_agent_generate_config_defaults():
     """get_agent_generate_config must apply the expected defaults."""
 
@@ -65,6 +76,16 @@ def test_get_agent_generate_config_defaults():
     assert first.threshold == types.HarmBlockThreshold.BLOCK_LOW_AND_ABOVE
 
 
+def test_get_agent_generate_config_reuses_default_config():
+    """Identical default-safety configs are built once and shared."""
+    first = get_agent_generate_config(temperature=0.2, max_output_tokens=128)
+    second = get_agent_generate_config(temperature=0.2, max_output_tokens=128)
+    other = get_agent_generate_config(temperature=0.3, max_output_tokens=128)
+
+    assert first is second
+    assert other is not first
+
+
 def test_get_agent_generate_config_custom_values():
     """get_agent_generate_config must accept parameter overrides."""
 
@@ -91,6 +112,27 @@ def test_get_agent_generate_config_for_grader_defaults_to_shared_config(monkeypa
     assert cfg.max_output_tokens == 1024
 
 
+def test_get_agent_generate_config_for_grader_gemini_tier_defaults_to_standard(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "gemini")
+    monkeypatch.delenv("GRADER_TIER", raising=False)
+
+    cfg = get_agent_generate_config_for("grader")
+    assert cfg.service_tier == types.ServiceTier.STANDARD
+
+    monkeypatch.setenv("GRADER_TIER", "flex")
+
+    cfg = get_agent_generate_config_for("grader")
+    assert cfg.service_tier == types.ServiceTier.FLEX
+
+
+def test_get_agent_generate_config_for_grader_unknown_tier_falls_back(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "gemini")
+    monkeypatch.setenv("GRADER_TIER", "flexx")
+
+    cfg = get_agent_generate_config_for("grader")
+    assert cfg.service_tier == types.ServiceTier.STANDARD
+
+
 def test_get_agent_generate_config_for_grader_openai_uses_env_overrides(monkeypatch):
     monkeypatch.setenv("LLM_PROVIDER", "openai")
     monkeypatch.setenv("OPENAI_MODEL", "gpt-4o-mini")
@@ -0,0 +1,23 @@
+import asyncio
+
+from agents.graders import get_grader_semaphore
+
+
+def test_grader_semaphore_is_shared_within_a_loop_and_fresh_per_loop():
+    """Graders share one semaphore per loop; a new loop must not reuse a bound one."""
+
+    async def contend():
+        sem = get_grader_semaphore()
+        assert get_grader_semaphore() is sem
+
+        async def hold():
+            async with sem:
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(hold() for _ in range(4)))
+        return sem
+
+    first = asyncio.run(contend())
+    second = asyncio.run(contend())
+
+    assert first is not second
@@ -0,0 +1,81 @@
+import asyncio
+
+from google.adk.agents import LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events.event import Event
+from google.adk.sessions import InMemorySessionService
+from pydantic import ValidationError
+
+from agents import retry
+from agents.graders import create_criterion_grader
+from models.schemas import CriterionGrade
+
+
+def _truncated_output_error() -> ValidationError:
+    try:
+        CriterionGrade.model_validate_json('{"criterion_name": "Code Quality", "max_sc')
+    except ValidationError as exc:
+        return exc
+    raise AssertionError("truncated JSON should not validate")
+
+
+def _missing_field_error() -> ValidationError:
+    try:
+        CriterionGrade.model_validate_json('{"criterion_name": "Code Quality", "max_score": 30}')
+    except ValidationError as exc:
+        return exc
+    raise AssertionError("partial JSON should not validate")
+
+
+def _run_grader(monkeypatch, first_error: Exception):
+    grader = create_criterion_grader("Code Quality", "Evaluate code quality", 30)
+    calls = []
+
+    async def fake_run_async(self, ctx):
+        calls.append(self.name)
+        if len(calls) == 1:
+            raise first_error
+        event = Event(invocation_id=ctx.invocation_id, author=self.name)
+        event.actions.state_delta[grader.output_key] = {"score": 25}
+        yield event
+
+    monkeypatch.setattr(LlmAgent, "run_async", fake_run_async)
+    monkeypatch.setattr(retry, "backoff_delay", lambda attempt: 0)
+
+    async def scenario():
+        service = InMemorySessionService()
+        session = await service.create_session(app_name="test", user_id="u")
+        ctx = InvocationContext(
+            session_service=service, invocation_id="inv", agent=grader, session=session
+        )
+        return [event async for event in grader.run_async(ctx)]
+
+    events = asyncio.run(scenario())
+    deltas = [event.actions.state_delta for event in events]
+    return grader, calls, deltas
+
+
+def test_grader_retries_truncated_output(monkeypatch):
+    grader, calls, deltas = _run_grader(monkeypatch, _truncated_output_error())
+
+    assert len(calls) == 2
+    assert {grader.output_key: {"score": 25}} in deltas
+    assert not any(f"{grader.output_key}_error" in delta for delta in deltas)
+
+
+def test_grader_retries_missing_fields(monkeypatch):
+    grader, calls, deltas = _run_grader(monkeypatch, _missing_field_error())
+
+    assert len(calls) == 2
+    assert {grader.output_key: {"score": 25}} in deltas
+
+
+def test_grader_records_provider_error_without_raising(monkeypatch):
+    grader, calls, deltas = _run_grader(monkeypatch, RuntimeError("provider unavailable"))
+
+    assert len(calls) == 1
+    error = deltas[-1][f"{grader.output_key}_error"]
+    assert error["error_type"] == "grading"
+    assert error["error_message"] == "provider unavailable"
+    assert error["attempts"] == 1
+    assert error["criterion_name"] == "Code Quality"
@@ -17,6 +17,7 @@ import asyncio
 import json
 from tools.validate_rubric import validate_rubric
 from agent import RubricGuardrailPlugin
+from plugins.rubric_guardrail import _PROTECTED_AGENTS
 from agents import build_graders_from_rubric
 
 
@@ -484,7 +485,7 @@ def test_guardrail_blocks_invalid_rubric():
     assert validation_result["status"] == "invalid"
     
     # Check block message is generated
-    block_msg = plugin._build_block_message(agent.name, ctx)
+    block_msg = plugin._build_block_message(agent.name, validation_result)
     print(f"   Block message preview: {block_msg[:100]}...")
     
     assert "GRADING BLOCKED" in block_msg
@@ -493,6 +494,19 @@ def test_guardrail_blocks_invalid_rubric():
     print("   ✅ PASS: Guardrail correctly blocks invalid rubric")
 
 
+def test_guardrail_normalizes_text_validator_responses():
+    """Test: Free-text validator responses map to valid/invalid status."""
+    plugin = RubricGuardrailPlugin()
+
+    invalid = plugin._normalize_validation_payload("The rubric is INVALID: criteria Missing.")
+    assert invalid["status"] == "invalid"
+
+    valid = plugin._normalize_validation_payload("Rubric validated. Ready for grading!")
+    assert valid == {"status": "valid"}
+
+    assert plugin._normalize_validation_payload("Please send the rubric.") is None
+
+
 def test_guardrail_blocks_missing_validation():
     """Test: Guardrail blocks when no validation was done."""
     print("\n" + "="*60)
@@ -545,22 +559,14 @@ def test_guardrail_ignores_unprotected_agents():
     for name in unprotected:
         agent = MockAgent(name)
         # The plugin checks agent name first, before checking validation
-        is_protected = name in {
-            "ParallelGraders", "AggregatorAgent", "ApprovalAgent",
-            "FeedbackGeneratorAgent", "Grader_Code_Quality",
-            "Grader_Functionality", "Grader_Documentation"
-        }
+        is_protected = name in _PROTECTED_AGENTS
         print(f"     - {name}: protected={is_protected}")
         assert not is_protected, f"{name} should not be protected"
     
     print(f"   Testing protected agents (should be checked):")
     for name in protected:
         agent = MockAgent(name)
-        is_protected = name in {
-            "ParallelGraders", "AggregatorAgent", "ApprovalAgent",
-            "FeedbackGeneratorAgent", "Grader_Code_Quality",
-            "Grader_Functionality", "Grader_Documentation"
-        }
+        is_protected = name in _PROTECTED_AGENTS
         print(f"     - {name}: protected={is_protected}")
         assert is_protected, f"{name} should be protected"
     
@@ -626,6 +632,7 @@ def run_all_tests():
         ("Dynamic ParallelGraders from rubric", test_parallel_graders_dynamic_creation_from_rubric),
         ("ParallelGraders respects custom rubrics", test_parallel_graders_respects_custom_rubrics),
         ("Guardrail blocks invalid rubric", test_guardrail_blocks_invalid_rubric),
+        ("Guardrail normalizes text responses", test_guardrail_normalizes_text_validator_responses),
         ("Guardrail blocks missing validation", test_guardrail_blocks_missing_validation),
         ("Guardrail ignores unprotected agents", test_guardrail_ignores_unprotected_agents),
         ("Fix rubric after rejection", test_fix_rubric_after_rejection),
@@ -6,8 +6,6 @@ These tests verify:
 3. needs_approval returns False for scores between 50% and 90%
 """
 
-import asyncio
-
 from agents.approval import finalize_grade, needs_approval
 
 
@@ -39,13 +37,13 @@ def test_needs_approval_low_score():
     """needs_approval should return True for scores < 50%."""
     ctx = MockToolContext()
     
-    result = asyncio.run(needs_approval(
+    result = needs_approval(
         final_score=40,
         max_score=100,
         percentage=40.0,
         letter_grade="F",
         reason="Low score",
-    ))
+    )
     
     assert result is True
 
@@ -54,13 +52,13 @@ def test_needs_approval_high_score():
     """needs_approval should return True for scores > 90%."""
     ctx = MockToolContext()
     
-    result = asyncio.run(needs_approval(
+    result = needs_approval(
         final_score=95,
         max_score=100,
         percentage=95.0,
         letter_grade="A",
         reason="Exceptional score",
-    ))
+    )
     
     assert result is True
 
@@ -69,13 +67,13 @@ def test_needs_approval_normal_score():
     """needs_approval should return False for scores between 50% and 90%."""
     ctx = MockToolContext()
     
-    result = asyncio.run(needs_approval(
+    result = needs_approval(
         final_score=75,
         max_score=100,
         percentage=75.0,
         letter_grade="C",
         reason="Normal score",
-    ))
+    )
     
     assert result is False
 
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+import agent
+from services.session_store import BoundedInMemorySessionService
+
+
+def test_bounded_session_service_evicts_least_recently_used():
+    service = BoundedInMemorySessionService(max_sessions=2)
+
+    async def scenario():
+        await service.create_session(app_name="app", user_id="u", session_id="s1")
+        await service.create_session(app_name="app", user_id="u", session_id="s2")
+        # Touch s1 so s2 becomes the least recently used session.
+        assert await service.get_session(app_name="app", user_id="u", session_id="s1") is not None
+        await service.create_session(app_name="app", user_id="u", session_id="s3")
+        return [
+            await service.get_session(app_name="app", user_id="u", session_id=sid)
+            for sid in ("s1", "s2", "s3")
+        ]
+
+    s1, s2, s3 = asyncio.run(scenario())
+
+    assert s1 is not None
+    assert s2 is None
+    assert s3 is not None
+
+
+def test_build_session_service_defaults_to_bounded_memory():
+    assert isinstance(agent.build_session_service("memory"), BoundedInMemorySessionService)
+
+
+def test_build_session_service_postgres_requires_db_url(monkeypatch):
+    monkeypatch.setattr(agent, "SESSION_DB_URL", "")
+
+    with pytest.raises(ValueError, match="SESSION_DB_URL"):
+        agent.build_session_service("postgres")
+
+
+def test_build_session_service_sqlite_rejects_non_sqlite_url(monkeypatch):
+    monkeypatch.setattr(agent, "SESSION_DB_URL", "postgresql+asyncpg://db/grading")
+
+    with pytest.raises(ValueError, match="sqlite URL"):
+        agent.build_session_service("sqlite")
+
+
+def test_build_session_service_rejects_unknown_backend():
+    with pytest.raises(ValueError, match="Unsupported SESSION_BACKEND"):
+        agent.build_session_service("redis")
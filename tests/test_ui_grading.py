@@ -280,6 +280,17 @@ def test_map_runner_event_applies_state_delta_and_tool_confirmations(monkeypatch
     assert st.session_state.approval_reason == "edge"
 
 
+def test_new_session_id_is_time_ordered():
+    from ui.services.grading_runner import new_session_id
+
+    first = new_session_id()
+    second = new_session_id()
+
+    assert first.startswith("grading_")
+    assert first != second
+    assert first.split("_")[1] <= second.split("_")[1]
+
+
 def test_runner_creates_session_when_missing(monkeypatch):
     repo_root = Path(__file__).resolve().parents[2]
     if str(repo_root) not in sys.path:
@@ -381,10 +392,13 @@ def test_run_grading_integration_facade_stream_mapper(monkeypatch):
     async def fake_create_session(**kwargs):
         return types.SimpleNamespace(id=kwargs.get("session_id") or "s-new")
 
+    sent_texts: list[str] = []
+
     class FakeRunner:
         async def run_async(self, user_id: str, session_id: str, new_message: Any):
             parts = getattr(new_message, "parts", None) or []
             text = getattr(parts[0], "text", "") if parts else ""
+            sent_texts.append(text)
 
             if isinstance(text, str) and "criteria" in text:
                 yield FakeEvent(state_delta={"rubric_validation": {"status": "valid"}})
@@ -442,13 +456,15 @@ def test_run_grading_integration_facade_stream_mapper(monkeypatch):
     )
     monkeypatch.setattr(grading, "ADK_AVAILABLE", True)
 
-    st.session_state.rubric_json = json.dumps(
-        {"criteria": [{"name": "Q", "max_score": 1, "description": "d"}]}
-    )
+    rubric = {"criteria": [{"name": "Q", "max_score": 1, "description": "d"}]}
+    st.session_state.rubric_json = json.dumps(rubric, indent=2)
     st.session_state.submission_text = "print('x')"
 
     events = list(grading.run_grading())
 
+    # Rubric is forwarded without pretty-print whitespace
+    assert sent_texts[0] == json.dumps(rubric, separators=(",", ":"))
+
     assert events[0]["type"] == "step_start"
     assert events[0]["step"] == "validating"
     assert any(e.get("type") == "criterion_graded" for e in events)
@@ -9,6 +9,7 @@ Concept from course: Day 2 - Custom Tools (FunctionTool)
 """
 
 import json
+import sys
 from typing import Any, Dict, List, Optional
 
 from google.adk.tools.tool_context import ToolContext
@@ -50,7 +51,7 @@ def calculate_final_score(tool_context: ToolContext) -> dict:
             rubric = state.get("rubric")
             if rubric and isinstance(rubric, dict):
                 criteria = rubric.get("criteria", [])
-                grader_output_keys = [f"grade_{c.get('slug')}" for c in criteria if c.get('slug')]
+                grader_output_keys = [sys.intern(f"grade_{c.get('slug')}") for c in criteria if c.get('slug')]
         except Exception:
             pass
     
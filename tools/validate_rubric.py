@@ -11,22 +11,11 @@ RubricGuardrailPlugin can check it before allowing grading agents to run.
 """
 
 import json
-import re
-import unicodedata
 from typing import Any
 
 from google.adk.tools.tool_context import ToolContext
 
-
-def _slugify(text: str) -> str:
-    """Normalize arbitrary text into a safe identifier."""
-    if not text:
-        return "criterion"
-    normalized = unicodedata.normalize("NFKD", text)
-    ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
-    slug = re.sub(r"[^a-zA-Z0-9]+", "_", ascii_text)
-    slug = slug.strip("_").lower()
-    return slug or "criterion"
+from utils.text_utils import slugify
 
 
 def validate_rubric(rubric_json: str, tool_context: ToolContext) -> dict:
@@ -115,7 +104,7 @@ def validate_rubric(rubric_json: str, tool_context: ToolContext) -> dict:
             errors.append(f"{prefix}: missing 'description' field")
 
         # Persist slug for downstream agents/tools
-        slug = _slugify(criterion.get("name"))
+        slug = slugify(criterion.get("name"))
         original_slug = slug
         counter = 2
         while slug in used_slugs:
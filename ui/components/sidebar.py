@@ -1,5 +1,6 @@
 """Sidebar component for rubric and submission setup."""
 
+import functools
 import json
 from typing import Callable
 
@@ -193,50 +194,58 @@ def _process_rubric_text(text: str) -> None:
     _validate_and_store_rubric(text)
 
 
-def _validate_and_store_rubric(json_str: str) -> None:
-    """Validate rubric JSON and store in session state."""
+@functools.lru_cache(maxsize=32)
+def _check_rubric_json(json_str: str) -> tuple[str, ...]:
+    """Return validation errors for a rubric JSON string.
+
+    Streamlit reruns the script on every interaction, so the same rubric text
+    is checked over and over; results are cached by content.
+    """
     errors = []
     
     try:
         rubric = json.loads(json_str)
+    except json.JSONDecodeError as e:
+        return (f"Invalid JSON: {str(e)}",)
+    
+    # Basic validation
+    if not isinstance(rubric, dict):
+        errors.append("Rubric must be a JSON object")
+    else:
+        if "name" not in rubric:
+            errors.append("Missing required field: 'name'")
         
-        # Basic validation
-        if not isinstance(rubric, dict):
-            errors.append("Rubric must be a JSON object")
+        if "criteria" not in rubric:
+            errors.append("Missing required field: 'criteria'")
+        elif not isinstance(rubric.get("criteria"), list):
+            errors.append("'criteria' must be an array")
+        elif len(rubric.get("criteria", [])) == 0:
+            errors.append("'criteria' must have at least one item")
         else:
-            if "name" not in rubric:
-                errors.append("Missing required field: 'name'")
-            
-            if "criteria" not in rubric:
-                errors.append("Missing required field: 'criteria'")
-            elif not isinstance(rubric.get("criteria"), list):
-                errors.append("'criteria' must be an array")
-            elif len(rubric.get("criteria", [])) == 0:
-                errors.append("'criteria' must have at least one item")
-            else:
-                for i, criterion in enumerate(rubric["criteria"]):
-                    if not isinstance(criterion, dict):
-                        errors.append(f"Criterion {i+1} must be an object")
-                        continue
-                    if "name" not in criterion:
-                        errors.append(f"Criterion {i+1} missing 'name'")
-                    if "max_score" not in criterion:
-                        errors.append(f"Criterion {i+1} missing 'max_score'")
-                    elif not isinstance(criterion.get("max_score"), (int, float)):
-                        errors.append(f"Criterion {i+1} 'max_score' must be a number")
-                    elif criterion.get("max_score", 0) <= 0:
-                        errors.append(f"Criterion {i+1} 'max_score' must be positive")
-                    if "description" not in criterion:
-                        errors.append(f"Criterion {i+1} missing 'description'")
-        
-        st.session_state.rubric_json = json_str
-        st.session_state.rubric_valid = len(errors) == 0
-        st.session_state.rubric_errors = errors
-        
-    except json.JSONDecodeError as e:
-        st.session_state.rubric_json = json_str
-        st.session_state.rubric_valid = False
-        st.session_state.rubric_errors = [f"Invalid JSON: {str(e)}"]
+            for i, criterion in enumerate(rubric["criteria"]):
+                if not isinstance(criterion, dict):
+                    errors.append(f"Criterion {i+1} must be an object")
+                    continue
+                if "name" not in criterion:
+                    errors.append(f"Criterion {i+1} missing 'name'")
+                if "max_score" not in criterion:
+                    errors.append(f"Criterion {i+1} missing 'max_score'")
+                elif not isinstance(criterion.get("max_score"), (int, float)):
+                    errors.append(f"Criterion {i+1} 'max_score' must be a number")
+                elif criterion.get("max_score", 0) <= 0:
+                    errors.append(f"Criterion {i+1} 'max_score' must be positive")
+                if "description" not in criterion:
+                    errors.append(f"Criterion {i+1} missing 'description'")
+    
+    return tuple(errors)
+
+
+def _validate_and_store_rubric(json_str: str) -> None:
+    """Validate rubric JSON and store in session state."""
+    errors = _check_rubric_json(json_str)
+    st.session_state.rubric_json = json_str
+    st.session_state.rubric_valid = len(errors) == 0
+    st.session_state.rubric_errors = list(errors)
 
 
 def _process_submission_file(file) -> None:
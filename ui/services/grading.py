@@ -6,12 +6,12 @@ including session management, rubric validation, and grading execution.
 
 import asyncio
 import json
-import uuid
 from typing import Any, AsyncGenerator, Generator
 
 import streamlit as st
 
 from ui.services.grading_mapper import map_runner_event
+from ui.services.grading_runner import new_session_id
 from ui.services.grading_runner import run_runner_events as run_runner_events_impl
 
 try:
@@ -34,7 +34,7 @@ def start_grading_session() -> str:
     """
     # Generate a new session ID if not exists
     if not st.session_state.grading_session_id:
-        session_id = str(uuid.uuid4())
+        session_id = new_session_id()
         st.session_state.grading_session_id = session_id
     
     return st.session_state.grading_session_id
@@ -142,11 +142,15 @@ def run_grading() -> Generator[dict[str, Any], None, None]:
         return
 
     try:
-        json.loads(rubric_json)
+        rubric = json.loads(rubric_json)
     except json.JSONDecodeError as e:
         yield {"type": "error", "step": "validation", "data": {"message": f"Invalid rubric JSON: {e}"}}
         return
 
+    # Pasted rubrics are usually pretty-printed; indentation is billed as input
+    # tokens on every turn that carries the rubric, so send it compacted.
+    rubric_json = json.dumps(rubric, separators=(",", ":"), ensure_ascii=False)
+
     if not ADK_AVAILABLE:
         yield {
             "type": "error",
@@ -1,9 +1,18 @@
+import time
 import uuid
 from typing import Any, AsyncGenerator
 
 import streamlit as st
 
 
+def new_session_id() -> str:
+    """Time-ordered session id: ms timestamp prefix plus a short random suffix.
+
+    Ids created later sort later, so session-table inserts stay append-mostly.
+    """
+    return f"grading_{int(time.time() * 1000):013x}_{uuid.uuid4().hex[:4]}"
+
+
 async def run_runner_events(
     rubric_json: str,
     submission_text: str,
@@ -14,7 +23,7 @@ async def run_runner_events(
 ) -> AsyncGenerator[dict[str, Any], None]:
     """Async generator: send rubric and submission to ADK Runner and yield raw events."""
     if not st.session_state.grading_session_id:
-        st.session_state.grading_session_id = str(uuid.uuid4())
+        st.session_state.grading_session_id = new_session_id()
 
     user_id = "teacher"
     session_id = st.session_state.grading_session_id
@@ -1,14 +1,19 @@
+import functools
 import re
 import unicodedata
 from typing import Optional
 
 
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+
+@functools.lru_cache(maxsize=512)
 def slugify(text: Optional[str]) -> str:
-    """Normalize arbitrary text into a safe identifier."""
+    """Normalize arbitrary text into a safe identifier (cached; names repeat per rubric)."""
     if not text:
         return "criterion"
     normalized = unicodedata.normalize("NFKD", text)
     ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
-    slug = re.sub(r"[^a-zA-Z0-9]+", "_", ascii_text)
+    slug = _NON_ALNUM_RE.sub("_", ascii_text)
     slug = slug.strip("_").lower()
     return slug or "criterion"